@@ -4,10 +4,20 @@ Docling Conversion Service - FastAPI application
 Converts PDF and Word documents to structured XML formats using the Docling library.
 """
 
+import asyncio
+import hashlib
 import logging
+import os
+import shutil
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse
+from typing import Optional, Tuple
+import orjson
+from fastapi import FastAPI, Request, Response, UploadFile, File, Form, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
 from models.schemas import (
     HealthResponse,
     SupportedFormatsResponse
@@ -15,19 +25,127 @@ from models.schemas import (
 from models.job_models import (
     JobInfo,
     JobStartResponse,
-    JobResultResponse
+    JobResultResponse,
+    JobStatus
 )
-from services.docling_converter import DoclingConverter
+from services.docling_converter import DoclingConverter, warmup_conversion_pool
 from services.job_manager import get_job_manager
 
 # Configure logging
-# Enable DEBUG level to capture Docling's internal processing stages
+# Default to INFO; set LOG_LEVEL=DEBUG to capture Docling's internal
+# processing stages. At DEBUG, Docling emits per-page/per-model lines -
+# tens of thousands of formatted strings per large PDF, all competing
+# with /jobs/{id} polls on the event-loop thread.
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.getenv("LOG_LEVEL", "INFO"),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Keep Docling's own loggers quiet unless explicitly requested
+if os.getenv("DOCLING_DEBUG") != "1":
+    logging.getLogger("docling").setLevel(logging.WARNING)
+    logging.getLogger("docling_core").setLevel(logging.WARNING)
+
+# Upload streaming chunk size (1 MiB) - caps memory usage regardless of file size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Maximum accepted upload size. Oversize PDFs are rejected up front with a
+# 413 instead of occupying a conversion worker slot for minutes.
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(500 * 1024 * 1024)))
+
+# Staging directory for uploads. Created once at import rather than per
+# request - for an established deployment the per-request mkdir was just a
+# wasted stat + mkdir(EEXIST) syscall pair on every upload.
+TEMP_DIR = Path("/app/data/temp")
+TEMP_DIR.mkdir(parents=True, exist_ok=True)
+
+# States a job can never leave - anything else means the result isn't ready.
+# Enum identity membership here avoids per-request string coercions and makes
+# a future new state an explicit decision rather than a silent fall-through.
+TERMINAL_STATES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+# In-process result cache mapping (sha256 digest, output_format) to the job
+# that already produced that result on disk. A repeat upload of an identical
+# file short-circuits the expensive conversion pipeline and reuses the
+# previous job's result file instantly. Bounded LRU of job ids only - the
+# actual content lives on disk.
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "32"))
+_result_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+
+def _hash_file(path: Path) -> str:
+    """Compute the sha256 digest of a file already on disk."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _spooled_file_path(file: UploadFile) -> Optional[str]:
+    """
+    Return the on-disk path of an upload's spool file, if it has one.
+
+    Starlette backs UploadFile with a SpooledTemporaryFile that rolls over
+    to a real temp file at 1 MiB. When that temp file has a usable path
+    (platform-dependent - on Linux TemporaryFile is usually anonymous),
+    the upload bytes are already on disk and can be moved into place
+    instead of being copied through Python a second time.
+    """
+    spooled = getattr(file, "file", None)
+    if not getattr(spooled, "_rolled", False):
+        return None
+    name = getattr(spooled, "name", None)
+    if isinstance(name, str) and os.path.exists(name):
+        return name
+    return None
+
+
+def _copy_spool_kernel(file: UploadFile, dest: Path) -> bool:
+    """
+    Stage a rolled-over upload with os.copy_file_range.
+
+    On Linux the rolled spool file is usually anonymous (unlinked), so it
+    can't be renamed into place - but it still has a file descriptor, and
+    copy_file_range moves the bytes kernel-side without pulling them
+    through Python buffers. Returns False when the syscall is missing or
+    refuses the fd pair (e.g. copying across incompatible filesystems),
+    in which case the caller falls back to the chunked Python copy.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        src_fd = file.file.fileno()
+    except (AttributeError, OSError, ValueError):
+        return False
+    try:
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        dst_fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while os.copy_file_range(src_fd, dst_fd, UPLOAD_CHUNK_SIZE * 64):
+                pass
+        finally:
+            os.close(dst_fd)
+        return True
+    except OSError as e:
+        logger.warning("copy_file_range staging failed, falling back: %s", e)
+        dest.unlink(missing_ok=True)
+        return False
+
+
+def _result_cache_get(digest: str, output_format: str) -> Optional[str]:
+    """Look up the job id of a cached conversion, refreshing its LRU position."""
+    key = (digest, output_format)
+    job_id = _result_cache.get(key)
+    if job_id is not None:
+        _result_cache.move_to_end(key)
+    return job_id
+
+
+def _result_cache_put(digest: str, output_format: str, job_id: str):
+    """Record which job produced a result, evicting the oldest entry if full."""
+    _result_cache[(digest, output_format)] = job_id
+    while len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+
 # Create FastAPI app with metadata for Swagger
 app = FastAPI(
     title="Docling Conversion Service",
@@ -48,36 +166,68 @@ app = FastAPI(
     """,
     version="1.0.0",
     docs_url="/swagger-ui",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson serializes responses several times faster than the stdlib
+    # encoder - this matters most on the /jobs/{id} polling hot path and
+    # the multi-MB /jobs/{id}/result payloads.
+    default_response_class=ORJSONResponse
 )
 
-# Initialize converter
-converter = DoclingConverter()
+# Result payloads (HTML with base64 images) compress 3-10x; compress
+# anything beyond 16 KiB at a modest level so bandwidth drops without
+# noticeable CPU cost. Uvicorn keeps connections alive by default, so
+# pollers reuse the same connection for compressed responses.
+app.add_middleware(GZipMiddleware, minimum_size=16384, compresslevel=4)
+
+# Initialize converter - memoized so any repeated lookup (or stray
+# re-import during hot reload) reuses the same instance
+@lru_cache(maxsize=1)
+def get_converter() -> DoclingConverter:
+    """Process-wide DoclingConverter instance."""
+    return DoclingConverter()
+
+
+converter = get_converter()
+
+# /health and /formats return constant data - precompute the serialized
+# bytes once and serve them with an ETag so frequent pollers (Docker
+# healthcheck, infra monitors) skip Pydantic construction and JSON
+# encoding entirely, replying 304 when If-None-Match matches.
+_HEALTH_JSON = orjson.dumps({"status": "healthy", "version": "1.0.0"})
+_HEALTH_ETAG = hashlib.md5(_HEALTH_JSON).hexdigest()
+_FORMATS_JSON = orjson.dumps({"formats": converter.supported_formats})
+_FORMATS_ETAG = hashlib.md5(_FORMATS_JSON).hexdigest()
+
+
+def _cached_json_response(request: Request, content: bytes, etag: str) -> Response:
+    """Serve precomputed JSON bytes, honoring If-None-Match with a 304."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
+async def health_check(request: Request):
     """
     Health check endpoint.
 
     Returns service status and version information.
     """
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0"
-    )
+    return _cached_json_response(request, _HEALTH_JSON, _HEALTH_ETAG)
 
 
 @app.get("/formats", response_model=SupportedFormatsResponse, tags=["Info"])
-async def get_supported_formats():
+async def get_supported_formats(request: Request):
     """
     List supported output formats.
 
     Returns all formats that can be used for document conversion.
     """
-    return SupportedFormatsResponse(
-        formats=converter.supported_formats
-    )
+    return _cached_json_response(request, _FORMATS_JSON, _FORMATS_ETAG)
 
 
 @app.get("/", tags=["Info"])
@@ -97,8 +247,13 @@ async def root():
 
 @app.post("/convert-async", response_model=JobStartResponse, tags=["Conversion"])
 async def convert_document_async(
+    request: Request,
     file: UploadFile = File(..., description="PDF or Word document to convert"),
-    output_format: str = Form(default="html", description="Output format (html, markdown, docbook)")
+    output_format: str = Form(default="html", description="Output format (html, markdown, docbook)"),
+    embed_images: bool = Form(default=True, description="Embed images as base64 data URIs; when false, the HTML references images served from /jobs/{job_id}/images/"),
+    pretty_json: bool = Form(default=False, description="Indent json output for human readers; compact by default"),
+    do_ocr: bool = Form(default=False, description="Run OCR on page images; only needed for scanned PDFs without a text layer"),
+    do_table_structure: bool = Form(default=True, description="Run the table-structure model")
 ):
     """
     Start async conversion job - returns immediately with job ID.
@@ -119,41 +274,139 @@ async def convert_document_async(
 
     Returns job_id for tracking progress via /jobs/{job_id}
     """
-    logger.info(f"Async conversion request: file={file.filename}, format={output_format}")
+    logger.info("Async conversion request: file=%s, format=%s", file.filename, output_format)
 
     try:
+        # Reject oversize uploads before touching the stream. The streaming
+        # copy below enforces the same cap for clients that lie about (or
+        # omit) Content-Length.
+        declared_size = int(request.headers.get("content-length", "0") or 0)
+        if declared_size > MAX_UPLOAD_BYTES or (file.size or 0) > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Upload exceeds maximum size of {MAX_UPLOAD_BYTES} bytes"
+            )
+
         # Validate file type
         if not converter.validate_file(file.filename):
             raise HTTPException(
                 status_code=400,
-                detail=f"Unsupported file type. Supported extensions: {', '.join(converter.supported_extensions)}"
+                detail=converter.unsupported_message
             )
 
-        # Save file to temporary directory
-        temp_dir = Path("/app/data/temp")
-        temp_dir.mkdir(parents=True, exist_ok=True)
-
-        input_file_path = temp_dir / file.filename
-        logger.info(f"Saving uploaded file to {input_file_path}")
-
-        contents = await file.read()
-        with open(input_file_path, "wb") as f:
-            f.write(contents)
+        # Save file to a per-upload staging directory. Staging everything at
+        # TEMP_DIR/<filename> would let a concurrent or queued upload with
+        # the same filename but different bytes overwrite the input while a
+        # conversion is still pending - and the digest hashed at upload time
+        # would then be cached against a result built from other content.
+        staging_dir = TEMP_DIR / uuid.uuid4().hex
+        staging_dir.mkdir()
+        input_file_path = staging_dir / file.filename
+        logger.info("Saving uploaded file to %s", input_file_path)
+
+        spool_path = _spooled_file_path(file)
+        if spool_path is not None:
+            # The upload already rolled over to a real temp file - move it
+            # into place (a rename on the same filesystem) and hash from
+            # disk, instead of passing every byte through Python again.
+            await asyncio.to_thread(shutil.move, spool_path, input_file_path)
+            digest = await asyncio.to_thread(_hash_file, input_file_path)
+        elif (getattr(file.file, "_rolled", False)
+                and await asyncio.to_thread(_copy_spool_kernel, file, input_file_path)):
+            # Rolled to an anonymous temp file: kernel-space copy into place,
+            # then hash the staged file with OpenSSL's accelerated SHA-256 -
+            # neither pass moves the bytes through Python buffers.
+            digest = await asyncio.to_thread(_hash_file, input_file_path)
+        else:
+            # Stream-copy in fixed-size chunks so large PDFs never sit fully in
+            # memory, and run the blocking writes off the event loop so concurrent
+            # /jobs/{id} polls stay responsive during the upload.
+            # Hash while copying - hashlib releases the GIL and uses OpenSSL's
+            # accelerated SHA-256, so this adds near-zero cost to an I/O-bound upload.
+            # A failed kernel copy above may have left the spool fd mid-file;
+            # rewind so the fallback stages the whole upload.
+            await file.seek(0)
+            content_hash = hashlib.sha256()
+            total_bytes = 0
+            try:
+                with open(input_file_path, "wb") as f:
+                    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                        total_bytes += len(chunk)
+                        if total_bytes > MAX_UPLOAD_BYTES:
+                            raise HTTPException(
+                                status_code=413,
+                                detail=f"Upload exceeds maximum size of {MAX_UPLOAD_BYTES} bytes"
+                            )
+                        content_hash.update(chunk)
+                        await asyncio.to_thread(f.write, chunk)
+            except HTTPException:
+                # Don't leave a truncated staged upload behind
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                raise
+            digest = content_hash.hexdigest()
 
         # Create job
         job_manager = get_job_manager()
-        job_id = job_manager.create_job(
+        job_id = await job_manager.create_job(
             filename=file.filename,
             output_format=output_format
         )
 
-        # Define conversion function for background worker
+        # Duplicate upload: reuse the previous job's result file instead of
+        # re-running the expensive conversion pipeline. Only for embedded
+        # output - referenced-image HTML resolves its images through the
+        # owning job's /jobs/{id}/images/ URL, which a reusing job lacks.
+        cache_format = output_format
+        if pretty_json and output_format == "json":
+            cache_format += "+pretty"
+        if do_ocr:
+            cache_format += "+ocr"
+        if not do_table_structure:
+            cache_format += "-tables"
+        prior_job_id = _result_cache_get(digest, cache_format) if embed_images else None
+        if prior_job_id is not None:
+            prior_job = await job_manager.get_job(prior_job_id)
+            if (prior_job
+                    and prior_job.output_path
+                    and Path(prior_job.output_path).exists()):
+                logger.info("Duplicate upload detected (sha256=%s...), reusing result of job %s", digest[:12], prior_job_id)
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                await job_manager.complete_job(
+                    job_id,
+                    output_path=prior_job.output_path,
+                    page_count=prior_job.total_pages,
+                    message="Result served from cache (duplicate upload)"
+                )
+                return JobStartResponse(
+                    job_id=job_id,
+                    message=f"Duplicate of a previous upload - cached result available for {file.filename}"
+                )
+
+        # Define conversion function for background worker. The converter
+        # writes the result file itself (inside the worker process), so the
+        # output never travels through memory as one giant string.
+        images_dir = None if embed_images else job_manager.results_dir / job_id / "images"
+        result_path = job_manager.result_path(job_id, output_format)
+
         async def conversion_task(job_id: str, progress_callback):
-            return await converter.convert_with_progress(
-                input_file_path=input_file_path,
-                output_format=output_format,
-                progress_callback=progress_callback
-            )
+            try:
+                _, page_count, error = await converter.convert_with_progress(
+                    input_file_path=input_file_path,
+                    output_format=output_format,
+                    progress_callback=progress_callback,
+                    images_dir=images_dir,
+                    output_path=result_path,
+                    pretty=pretty_json,
+                    do_ocr=do_ocr,
+                    do_table_structure=do_table_structure
+                )
+            finally:
+                # The staged input (and any page-range slices written next
+                # to it) is only needed for this one conversion
+                await asyncio.to_thread(shutil.rmtree, staging_dir, ignore_errors=True)
+            if error is None and embed_images:
+                _result_cache_put(digest, cache_format, job_id)
+            return str(result_path), page_count, error
 
         # Enqueue job
         await job_manager.enqueue_job(job_id, conversion_task)
@@ -163,12 +416,16 @@ async def convert_document_async(
             message=f"Conversion job started for {file.filename}"
         )
 
+    except HTTPException:
+        # Already a proper client/server error - don't re-wrap as a 500
+        raise
+
     except ValueError as e:
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
     except Exception as e:
-        logger.error(f"Failed to start conversion job: {str(e)}", exc_info=True)
+        logger.error("Failed to start conversion job: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to start conversion: {str(e)}"
@@ -197,12 +454,14 @@ async def get_job_status(job_id: str):
     Poll this endpoint every 2 seconds to get real-time progress.
     """
     job_manager = get_job_manager()
-    job = job_manager.get_job(job_id)
+    # JobManager caches the serialized status between mutations, so the
+    # common poll (nothing changed) skips model serialization entirely
+    payload = await job_manager.get_job_serialized(job_id)
 
-    if not job:
+    if payload is None:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-    return job
+    return Response(content=payload, media_type="application/json")
 
 
 @app.get("/jobs/{job_id}/result", response_model=JobResultResponse, tags=["Jobs"])
@@ -220,37 +479,87 @@ async def get_job_result(job_id: str):
     **Response:** JSON with output_content containing full HTML/XML with embedded images
     """
     job_manager = get_job_manager()
-    job = job_manager.get_job(job_id)
+    job = await job_manager.get_job(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-    if job.status == "processing" or job.status == "queued":
+    if job.status not in TERMINAL_STATES:
         raise HTTPException(status_code=425, detail="Job not yet completed")
 
-    if job.status == "failed":
+    if job.status is JobStatus.FAILED:
         return JobResultResponse(
             job_id=job_id,
             success=False,
             error=job.error
         )
 
-    if job.status == "cancelled":
+    if job.status is JobStatus.CANCELLED:
         return JobResultResponse(
             job_id=job_id,
             success=False,
             error="Job was cancelled"
         )
 
-    # Job completed successfully - return stored content
+    # Job completed successfully - read result from disk. Content is only
+    # materialized here, not kept resident on the JobInfo between polls.
+    output_content = None
+    if job.output_path:
+        try:
+            output_content = await asyncio.to_thread(
+                Path(job.output_path).read_text, "utf-8"
+            )
+        except OSError as e:
+            logger.error("Failed to read result file for job %s: %s", job_id, e)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Result file unavailable: {e}"
+            )
+
     return JobResultResponse(
         job_id=job_id,
         success=True,
-        output_content=job.output_content,
+        output_content=output_content,
         page_count=job.total_pages
     )
 
 
+@app.get("/jobs/{job_id}/images/{filename}", tags=["Jobs"])
+async def get_job_image(job_id: str, filename: str):
+    """
+    Serve an extracted image for a job converted with embed_images=false.
+
+    Images are streamed from disk with long-lived cache headers so a
+    browser rendering the result HTML fetches them in parallel and only
+    once.
+
+    **Example:**
+    ```bash
+    curl http://localhost:4808/jobs/{job_id}/images/image_000001.png
+    ```
+    """
+    job_manager = get_job_manager()
+    job = await job_manager.get_job(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    images_dir = (job_manager.results_dir / job_id / "images").resolve()
+    image_path = (images_dir / filename).resolve()
+
+    # Reject path traversal attempts
+    if images_dir not in image_path.parents:
+        raise HTTPException(status_code=400, detail="Invalid image name")
+
+    if not image_path.is_file():
+        raise HTTPException(status_code=404, detail=f"Image {filename} not found")
+
+    return FileResponse(
+        image_path,
+        headers={"Cache-Control": "public, max-age=86400, immutable"}
+    )
+
+
 @app.delete("/jobs/{job_id}", tags=["Jobs"])
 async def cancel_job(job_id: str):
     """
@@ -264,10 +573,10 @@ async def cancel_job(job_id: str):
     ```
     """
     job_manager = get_job_manager()
-    cancelled = job_manager.cancel_job(job_id)
+    cancelled = await job_manager.cancel_job(job_id)
 
     if not cancelled:
-        job = job_manager.get_job(job_id)
+        job = await job_manager.get_job(job_id)
         if not job:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
         else:
@@ -294,6 +603,12 @@ async def startup_event():
     await job_manager.start_worker()
     logger.info("Job manager worker started")
 
+    # Pre-warm the conversion workers in the background so the first real
+    # job doesn't pay the model download/initialization cost. Disable with
+    # PRELOAD_MODELS=0 (e.g. for fast dev restarts).
+    if os.getenv("PRELOAD_MODELS", "1") == "1":
+        asyncio.create_task(asyncio.to_thread(warmup_conversion_pool))
+
 
 # Shutdown event
 @app.on_event("shutdown")
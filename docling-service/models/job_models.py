@@ -1,9 +1,14 @@
 """Job status models for async PDF conversion."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def utc_now() -> datetime:
+    """Timezone-aware replacement for the deprecated datetime.utcnow()."""
+    return datetime.now(timezone.utc)
 
 
 class JobStatus(str, Enum):
@@ -17,13 +22,19 @@ class JobStatus(str, Enum):
 
 class JobInfo(BaseModel):
     """Job information and status."""
+
+    # Internal updates mutate trusted fields on the polling hot path;
+    # keep pydantic's assignment re-validation off so those writes stay
+    # plain attribute assignments.
+    model_config = ConfigDict(validate_assignment=False)
+
     job_id: str = Field(..., description="Unique job identifier")
     status: JobStatus = Field(..., description="Current job status")
     progress: float = Field(0.0, ge=0.0, le=1.0, description="Progress from 0.0 to 1.0")
     current_page: Optional[int] = Field(None, description="Current page being processed")
     total_pages: Optional[int] = Field(None, description="Total pages in document")
     message: str = Field("", description="Status message")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Job creation timestamp")
+    created_at: datetime = Field(default_factory=utc_now, description="Job creation timestamp")
     started_at: Optional[datetime] = Field(None, description="Processing start timestamp")
     completed_at: Optional[datetime] = Field(None, description="Completion timestamp")
     error: Optional[str] = Field(None, description="Error message if failed")
@@ -32,8 +43,12 @@ class JobInfo(BaseModel):
     filename: Optional[str] = Field(None, description="Original filename")
     output_format: Optional[str] = Field(None, description="Output format")
 
-    # Conversion result (stored when completed)
-    output_content: Optional[str] = Field(None, description="Converted content with base64-embedded images")
+    # Which service instance runs this job (host:pid). With a shared store
+    # and multiple workers, restart recovery must only reclaim its own jobs.
+    owner_id: Optional[str] = Field(None, description="Identifier of the worker instance that owns this job")
+
+    # Conversion result (written to disk when completed; read lazily on demand)
+    output_path: Optional[str] = Field(None, description="Path to the converted output file on disk")
 
 
 class JobStartResponse(BaseModel):
@@ -1,8 +1,15 @@
 """Docling document conversion service."""
 
+import asyncio
+import concurrent.futures
+import contextlib
+import multiprocessing
 import os
 import json
 import logging
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional, Callable, Awaitable
 from fastapi import UploadFile
@@ -10,77 +17,513 @@ from fastapi import UploadFile
 # Initialize logger first
 logger = logging.getLogger(__name__)
 
+# Thread budget for Docling's models. OpenMP reads OMP_NUM_THREADS when the
+# native libraries load, so it must be set before docling/torch are imported.
+# Docling's own default is 4 threads, which underuses larger hosts.
+DOCLING_NUM_THREADS = int(os.environ.get("DOCLING_THREADS", os.cpu_count() or 8))
+os.environ.setdefault("OMP_NUM_THREADS", str(DOCLING_NUM_THREADS))
+
 try:
     from docling.document_converter import DocumentConverter, PdfFormatOption
     from docling.datamodel.base_models import DocumentStream, PipelineOptions, InputFormat
-    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.datamodel.pipeline_options import (
+        PdfPipelineOptions,
+        AcceleratorOptions,
+        AcceleratorDevice
+    )
     from docling_core.types.doc import ImageRefMode
+    try:
+        from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+    except ImportError:
+        PyPdfiumDocumentBackend = None
     DOCLING_AVAILABLE = True
 except ImportError as e:
-    logger.warning(f"Docling not available: {e}")
+    logger.warning("Docling not available: %s", e)
     DOCLING_AVAILABLE = False
 
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PDFs above this page count are split into page-range slices that convert
+# in parallel on the worker pool (0 disables chunking). Docling's time and
+# memory scale super-linearly with page count, so slices keep both bounded.
+CHUNK_PAGES = int(os.getenv("CHUNK_PAGES", "50"))
+
+# Where the Docling model artifacts live. download_models() warms this
+# directory explicitly (its default is docling's own ~/.cache/docling,
+# which nothing here reads) and _get_document_converter points the
+# pipeline at it via artifacts_path. The marker file is written only
+# after a complete download pass, so an interrupted download retries
+# instead of being mistaken for a populated cache.
+DOCLING_ARTIFACTS_PATH = Path(
+    os.getenv("DOCLING_ARTIFACTS_PATH", "/app/data/models/docling")
+)
+_MODELS_READY_MARKER = DOCLING_ARTIFACTS_PATH / ".download-complete"
+
+# Placeholder result served when Docling is not installed. Built once at
+# import; _create_placeholder_output only substitutes the two dynamic values.
+_PLACEHOLDER_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<book xmlns="http://docbook.org/ns/docbook" version="5.0">
+    <info>
+        <title>Placeholder Document</title>
+        <subtitle>Converted by Docling Service</subtitle>
+    </info>
+    <chapter>
+        <title>Placeholder Chapter</title>
+        <para>
+            This is a placeholder output from the Docling service.
+            The actual Docling conversion will be implemented in Phase 1.2.
+        </para>
+        <para>
+            Source file: {}
+        </para>
+        <para>
+            Output format: {}
+        </para>
+    </chapter>
+</book>"""
+
+# Encoding for embedded images: png (docling's default, lossless), jpeg or
+# webp. Photographic figures compress 5-10x smaller as JPEG at quality 85,
+# which shrinks the base64-inflated HTML output proportionally.
+IMAGE_FORMAT = os.getenv("IMAGE_FORMAT", "png").lower()
+IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", "85"))
+
+
+# Process pool for conversions. Docling's layout/table models are CPU-bound
+# Python+PyTorch code, so concurrent jobs inside one process serialize on
+# the GIL no matter how they are queued; a pool of worker processes lets
+# N jobs run truly in parallel on an N-core host.
+_conversion_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_conversion_pool_lock = threading.Lock()
+
+# Per-worker-process converter: created once per child process so model
+# load cost is paid per worker, not per job.
+_worker_converter: Optional["DoclingConverter"] = None
+
+
+@lru_cache(maxsize=1)
+def _tune_batch_settings():
+    """
+    Scale docling's page/element batching to the host.
+
+    Docling's defaults process pages in small batches with a concurrency
+    of 2, which underuses larger hosts on the big PDFs this service
+    targets. Applied once per process, before the first pipeline is built;
+    each knob can be overridden through its environment variable. Silently
+    skipped on docling releases whose settings lack these fields.
+    """
+    try:
+        from docling.datamodel.settings import settings
+    except ImportError:
+        return
+    try:
+        settings.perf.page_batch_size = int(
+            os.getenv("DOCLING_PAGE_BATCH_SIZE", "8")
+        )
+        settings.perf.page_batch_concurrency = int(
+            os.getenv("DOCLING_PAGE_BATCH_CONCURRENCY", str(max(2, (os.cpu_count() or 4) // 2)))
+        )
+        settings.perf.elements_batch_size = int(
+            os.getenv("DOCLING_ELEMENTS_BATCH_SIZE", "32")
+        )
+        logger.info(
+            "Docling batch settings: page_batch_size=%d, page_batch_concurrency=%d, elements_batch_size=%d",
+            settings.perf.page_batch_size,
+            settings.perf.page_batch_concurrency,
+            settings.perf.elements_batch_size
+        )
+    except Exception as e:
+        logger.warning("Could not tune docling batch settings: %s", e)
+
+
+@lru_cache(maxsize=4)
+def _get_document_converter(
+    do_ocr: bool = False,
+    do_table_structure: bool = True
+) -> "DocumentConverter":
+    """
+    Process-wide DocumentConverter, cached per pipeline-option combo.
+
+    Model weights and the layout/table models are loaded once per process
+    and option combination, no matter how many DoclingConverter instances
+    are created or how often requests toggle the flags.
+
+    OCR defaults off: it dominates conversion time and the annual reports
+    this service handles are born-digital PDFs with a real text layer.
+    """
+    _tune_batch_settings()
+
+    # Configure pipeline options for image extraction
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.images_scale = 2.0  # 144 DPI (2.0 * 72 DPI)
+    pipeline_options.generate_page_images = False  # Don't need full page images
+    pipeline_options.generate_picture_images = True  # Extract figures/pictures
+    pipeline_options.do_ocr = do_ocr
+    pipeline_options.do_table_structure = do_table_structure
+
+    # Use the pre-downloaded model artifacts when the cache is complete;
+    # otherwise let docling fetch models itself during pipeline build
+    if _MODELS_READY_MARKER.exists():
+        pipeline_options.artifacts_path = DOCLING_ARTIFACTS_PATH
+
+    # Give the layout/table models the configured thread budget. When
+    # CONVERT_WORKERS > 1, tune DOCLING_THREADS down so the combined
+    # budget stays near the core count.
+    accel_kwargs = {
+        "num_threads": DOCLING_NUM_THREADS,
+        "device": AcceleratorDevice.AUTO
+    }
+    try:
+        import torch
+        if torch.cuda.is_available():
+            # Pick CUDA explicitly rather than trusting AUTO, and enable
+            # flash attention for the transformer-based models
+            accel_kwargs["device"] = AcceleratorDevice.CUDA
+            accel_kwargs["cuda_use_flash_attention2"] = True
+            logger.info("CUDA available - running layout/table models on GPU")
+        else:
+            # CPU fallback: align torch's intra-op pool with the budget
+            torch.set_num_threads(DOCLING_NUM_THREADS)
+    except ImportError:
+        pass
+
+    try:
+        pipeline_options.accelerator_options = AcceleratorOptions(**accel_kwargs)
+    except Exception:
+        # Older docling releases don't know cuda_use_flash_attention2
+        accel_kwargs.pop("cuda_use_flash_attention2", None)
+        pipeline_options.accelerator_options = AcceleratorOptions(**accel_kwargs)
+    logger.info("Docling accelerator configured with %d threads", DOCLING_NUM_THREADS)
+
+    # Backend selection: pypdfium converts text-heavy PDFs ~2.5x faster with
+    # a fraction of the peak memory of the default docling-parse backend.
+    # Set DOCLING_BACKEND=native for table-heavy documents that need the
+    # richer native parse.
+    backend_name = os.getenv("DOCLING_BACKEND", "pypdfium")
+    if backend_name == "pypdfium" and PyPdfiumDocumentBackend is not None:
+        pdf_format_option = PdfFormatOption(
+            pipeline_options=pipeline_options,
+            backend=PyPdfiumDocumentBackend
+        )
+        logger.info("Using pypdfium PDF backend")
+    else:
+        pdf_format_option = PdfFormatOption(pipeline_options=pipeline_options)
+        logger.info("Using native docling-parse PDF backend")
+
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: pdf_format_option
+        }
+    )
+
+
+def _init_worker():
+    """
+    Pool initializer: load the Docling models once per worker process.
+
+    Runs when a worker process is spawned, so the model download /
+    construction cost is paid at worker startup instead of inside the
+    first job the worker picks up.
+    """
+    global _worker_converter
+    _worker_converter = DoclingConverter()
+    if _worker_converter._ensure_converter_initialized():
+        try:
+            # Pre-build the PDF pipeline (loads layout/table models) so the
+            # first conversion doesn't pay that cost either
+            _worker_converter.converter.initialize_pipeline(InputFormat.PDF)
+        except Exception as e:
+            logger.warning("PDF pipeline pre-warm failed (will initialize on first job): %s", e)
+
+
+def _get_conversion_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Lazily create the shared conversion process pool.
+
+    Locked because the startup warmup runs on a to_thread worker while an
+    early first request can race it from the loop thread - without the
+    lock both would build a pool, doubling resident model memory and
+    orphaning one executor.
+    """
+    global _conversion_pool
+    if _conversion_pool is not None:
+        return _conversion_pool
+    with _conversion_pool_lock:
+        if _conversion_pool is not None:
+            return _conversion_pool
+        # Default to 2 workers: each worker holds a full set of Docling
+        # models in memory, so scaling to the core count by default would
+        # trade OOM risk for parallelism. Raise CONVERT_WORKERS on hosts
+        # with the RAM to match.
+        max_workers = int(os.getenv("CONVERT_WORKERS", "2"))
+        pool_kwargs = {
+            "max_workers": max_workers,
+            "initializer": _init_worker
+        }
+        # Recycle each worker after this many conversions so memory that
+        # native libraries fragment or leak across jobs is handed back to
+        # the OS; the replacement worker re-warms via the initializer.
+        # Requires the spawn start method (0 disables recycling).
+        max_tasks = int(os.getenv("CONVERT_WORKER_MAX_TASKS", "16"))
+        if max_tasks > 0:
+            pool_kwargs["max_tasks_per_child"] = max_tasks
+            pool_kwargs["mp_context"] = multiprocessing.get_context("spawn")
+        _conversion_pool = concurrent.futures.ProcessPoolExecutor(**pool_kwargs)
+        logger.info(
+            "Conversion process pool started with %d workers (recycle after %d tasks)",
+            max_workers, max_tasks
+        )
+    return _conversion_pool
+
+
+def warmup_conversion_pool():
+    """
+    Spin up the conversion pool and force every worker to load its models.
+
+    Submitting one trivial task per worker makes the executor spawn all
+    children, whose initializer loads the Docling models - so the first
+    real conversion request doesn't hit a cold start.
+    """
+    if not DOCLING_AVAILABLE:
+        logger.info("Docling not available - skipping model pre-warm")
+        return
+    pool = _get_conversion_pool()
+    futures = [pool.submit(os.getpid) for _ in range(pool._max_workers)]
+    concurrent.futures.wait(futures)
+    logger.info("Conversion workers pre-warmed (%d processes)", len(futures))
+
+
+def _convert_in_worker(
+    input_path: str,
+    output_format: str,
+    images_dir: Optional[str] = None,
+    output_path: Optional[str] = None,
+    pretty: bool = False,
+    do_ocr: bool = False,
+    do_table_structure: bool = True
+) -> Tuple[Optional[str], int]:
+    """
+    Run one conversion inside a pool worker process.
+
+    Module-level so it is picklable. Keeps a process-global DoclingConverter
+    warm across jobs. When output_path is given the export is written to
+    disk inside the worker and None is returned for the content, so the
+    (potentially huge) string is never pickled back to the parent.
+    """
+    global _worker_converter
+    if _worker_converter is None:
+        _worker_converter = DoclingConverter()
+    return _worker_converter.convert_document(
+        Path(input_path),
+        output_format,
+        images_dir=Path(images_dir) if images_dir else None,
+        output_path=Path(output_path) if output_path else None,
+        pretty=pretty,
+        do_ocr=do_ocr,
+        do_table_structure=do_table_structure
+    )
+
+
+def _write_text_atomic(path: Path, content: str):
+    """
+    Write a result file via a sibling temp file and os.replace.
+
+    The rename is atomic on POSIX, so a reader polling the result path
+    (the result endpoint, the duplicate-upload cache) never observes a
+    partially written file. The full extent is preallocated up front
+    where posix_fallocate exists, so the kernel reserves blocks for a
+    100+ MB export once instead of growing the file inside the write.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    data = content.encode("utf-8")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if data and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, len(data))
+            except OSError:
+                pass  # filesystem without fallocate support (e.g. some tmpfs)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _export_json(document, pretty: bool = False) -> str:
+    """
+    Lossless JSON export - compact unless pretty, orjson when available.
+
+    orjson serializes the dict-heavy document structure several times
+    faster than the stdlib encoder; fall back to stdlib if it's missing.
+    """
+    document_dict = document.export_to_dict()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(document_dict, option=option).decode("utf-8")
+    return json.dumps(document_dict, indent=2 if pretty else None)
+
+
+# Per-format exporters, resolved by one dict lookup in convert_document.
+# html (the default) is handled separately there because its embedded /
+# referenced / direct-to-file variants need extra context.
+if DOCLING_AVAILABLE:
+    EXPORTERS = {
+        "markdown": lambda document, pretty: document.export_to_markdown(image_mode=ImageRefMode.EMBEDDED),
+        "doctags": lambda document, pretty: document.export_to_doctags(),
+        "json": _export_json,
+    }
+else:
+    EXPORTERS = {}
+
+
+def _pdf_page_count(input_path: Path) -> Optional[int]:
+    """Cheap page count via pypdfium2, or None if it cannot be determined."""
+    if pypdfium2 is None:
+        return None
+    try:
+        doc = pypdfium2.PdfDocument(str(input_path))
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+    except Exception as e:
+        logger.warning("Could not read page count of %s: %s", input_path.name, e)
+        return None
+
+
+def _split_pdf(input_path: Path, chunk_pages: int) -> list:
+    """
+    Write page-range slices of a PDF next to the original file.
+
+    Returns the slice paths in document order; the caller owns cleanup.
+    """
+    src = pypdfium2.PdfDocument(str(input_path))
+    try:
+        total = len(src)
+        slice_paths = []
+        for start in range(0, total, chunk_pages):
+            end = min(start + chunk_pages, total)
+            dst = pypdfium2.PdfDocument.new()
+            dst.import_pages(src, list(range(start, end)))
+            slice_path = input_path.with_name(
+                f"{input_path.stem}.slice{start // chunk_pages:03d}.pdf"
+            )
+            dst.save(str(slice_path))
+            dst.close()
+            slice_paths.append(slice_path)
+        return slice_paths
+    finally:
+        src.close()
+
+
+def _stitch_html(parts: list) -> str:
+    """
+    Merge per-slice HTML exports into one document.
+
+    Keeps the first slice's document shell and splices the <body> content
+    of the remaining slices in before its closing tag.
+    """
+    first = parts[0]
+    close = first.rfind("</body>")
+    if close == -1:
+        return "".join(parts)
+    pieces = [first[:close]]
+    for part in parts[1:]:
+        open_tag = part.find("<body")
+        start = part.find(">", open_tag) + 1 if open_tag != -1 else 0
+        end = part.rfind("</body>")
+        if end == -1:
+            end = len(part)
+        pieces.append(part[start:end])
+    pieces.append(first[close:])
+    return "".join(pieces)
+
 
 class DoclingConverter:
     """Handles document conversion using Docling library."""
 
+    # Supported extensions without the dot - validate_file matches the
+    # lowercased tail after the last '.' directly against this set
+    _EXTS = frozenset({'pdf', 'docx', 'doc'})
+
     def __init__(self):
         """Initialize the converter."""
-        self.supported_extensions = {'.pdf', '.docx', '.doc'}
+        self.supported_extensions = frozenset('.' + ext for ext in self._EXTS)
         self.supported_formats = ['docbook', 'html', 'markdown']
-
-        # Don't initialize converter yet - will be lazy-loaded on first use
-        # This avoids downloading models during service startup
+        # Precomputed once - the validation error message is constant
+        self.unsupported_message = (
+            "Unsupported file type. Supported extensions: "
+            + ", ".join(sorted(self.supported_extensions))
+        )
+
+        # The converter itself is created in _ensure_converter_initialized.
+        # Worker processes pre-warm it via the pool initializer at startup
+        # (see _init_worker / PRELOAD_MODELS), so lazy init only happens when
+        # pre-warming was disabled or failed.
         self.converter = None
-        self._models_downloaded = False
+        self._converter_options = None
 
         if DOCLING_AVAILABLE:
-            logger.info("Docling library available - will initialize on first use")
+            logger.info("Docling library available")
         else:
             logger.warning("Docling library not available - will use placeholder mode")
 
-    def _ensure_converter_initialized(self):
+    def _ensure_converter_initialized(
+        self,
+        do_ocr: bool = False,
+        do_table_structure: bool = True
+    ):
         """
-        Lazily initialize the Docling converter and download models if needed.
+        Initialize the Docling converter and download models if needed.
 
-        This is called on first conversion attempt to avoid blocking service startup.
+        Normally invoked from the worker-pool initializer at startup;
+        also acts as a lazy fallback if pre-warming was skipped. Converters
+        are cached per option combo (see _get_document_converter), so
+        switching flags between jobs only rebuilds the pipeline once.
         """
         if not DOCLING_AVAILABLE:
             return False
 
-        if self.converter is not None:
+        options = (do_ocr, do_table_structure)
+        if self.converter is not None and self._converter_options == options:
             return True
 
         try:
-            logger.info("Initializing Docling converter (first use)...")
-
-            # Download models if not already cached
-            if not self._models_downloaded:
-                logger.info("Downloading Docling models from HuggingFace (this may take a moment)...")
+            logger.info("Initializing Docling converter...")
+
+            # Ensure models are cached locally. The marker only exists after
+            # a complete download pass (baked into the image / persisted
+            # volume), so a partial cache retries here; once present, skip
+            # the call entirely - even a cache-hit download does hub
+            # metadata round-trips that stall startup offline.
+            if not _MODELS_READY_MARKER.exists():
                 try:
-                    DocumentConverter.download_models_hf()
-                    self._models_downloaded = True
-                    logger.info("Models downloaded successfully")
+                    from docling.utils.model_downloader import download_models
+                    download_models(output_dir=DOCLING_ARTIFACTS_PATH)
+                    _MODELS_READY_MARKER.touch()
                 except Exception as e:
-                    logger.warning(f"Model download failed, will try direct initialization: {e}")
-
-            # Configure pipeline options for image extraction
-            pipeline_options = PdfPipelineOptions()
-            pipeline_options.images_scale = 2.0  # 144 DPI (2.0 * 72 DPI)
-            pipeline_options.generate_page_images = False  # Don't need full page images
-            pipeline_options.generate_picture_images = True  # Extract figures/pictures
-
-            # Initialize converter with image extraction enabled
-            self.converter = DocumentConverter(
-                format_options={
-                    InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-                }
+                    logger.warning("Model download failed, will try direct initialization: %s", e)
+
+            # Shared per-process converter with image extraction enabled
+            self.converter = _get_document_converter(do_ocr, do_table_structure)
+            self._converter_options = options
+            logger.info(
+                "Docling converter initialized (ocr=%s, table_structure=%s)",
+                do_ocr, do_table_structure
             )
-            logger.info("Docling converter initialized successfully with image extraction enabled")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to initialize Docling converter: {e}", exc_info=True)
+            logger.error("Failed to initialize Docling converter: %s", e, exc_info=True)
             return False
 
     def validate_file(self, filename: str) -> bool:
@@ -93,8 +536,12 @@ class DoclingConverter:
         Returns:
             True if file type is supported, False otherwise
         """
-        ext = Path(filename).suffix.lower()
-        return ext in self.supported_extensions
+        if not filename:
+            return False
+        # rpartition returns '' before the separator when there is no dot,
+        # leaving the whole name in [2] - which then simply won't match
+        head, _, ext = filename.rpartition('.')
+        return bool(head) and ext.lower() in self._EXTS
 
 
 
@@ -102,7 +549,12 @@ class DoclingConverter:
         self,
         input_file_path: Path,
         output_format: str,
-        progress_callback: Optional[Callable[[float, int, int, str], Awaitable[None]]] = None
+        progress_callback: Optional[Callable[[float, int, int, str], Awaitable[None]]] = None,
+        images_dir: Optional[Path] = None,
+        output_path: Optional[Path] = None,
+        pretty: bool = False,
+        do_ocr: bool = False,
+        do_table_structure: bool = True
     ) -> Tuple[Optional[str], Optional[int], Optional[str]]:
         """
         Convert document with progress tracking for background jobs.
@@ -112,25 +564,28 @@ class DoclingConverter:
             output_format: Target format (html, markdown, docbook)
             progress_callback: Async callback for progress updates
                               Accepts (progress, current_page, total_pages, message)
+            images_dir: When set, extracted images are written here and the
+                        HTML references them instead of embedding base64
+            output_path: When set, the result is written to this file inside
+                         the worker and output_content comes back as None
+            pretty: Indent json output for human readers (compact default)
+            do_ocr: Run OCR on page images (off by default)
+            do_table_structure: Run the table-structure model
 
         Returns:
             Tuple of (output_content, page_count, error_message)
-            output_content contains HTML/XML with base64-embedded images
+            output_content contains HTML/XML (base64-embedded images unless
+            images_dir is given); None when output_path was written instead
         """
         try:
             # Report starting
             if progress_callback:
                 await progress_callback(0.05, 0, 0, "Initializing conversion...")
 
-            # Try to initialize converter if not already done
-            converter_ready = self._ensure_converter_initialized()
-
-            if progress_callback:
-                await progress_callback(0.10, 0, 0, "Converter initialized")
-
-            # Perform conversion
-            if converter_ready and self.converter:
-                logger.info(f"Converting {input_file_path} with Docling to {output_format}")
+            # Perform conversion. Model initialization happens inside the
+            # worker processes, not here - the parent process stays light.
+            if DOCLING_AVAILABLE:
+                logger.info("Converting %s with Docling to %s", input_file_path, output_format)
 
                 if progress_callback:
                     await progress_callback(0.15, 0, 0, "Starting Docling conversion...")
@@ -138,7 +593,12 @@ class DoclingConverter:
                 content, page_count = await self._convert_with_docling_async(
                     input_file_path,
                     output_format,
-                    progress_callback
+                    progress_callback,
+                    images_dir=images_dir,
+                    output_path=output_path,
+                    pretty=pretty,
+                    do_ocr=do_ocr,
+                    do_table_structure=do_table_structure
                 )
             else:
                 # Fallback to placeholder for testing
@@ -151,116 +611,388 @@ class DoclingConverter:
                     input_file_path,
                     output_format
                 )
+                if output_path is not None:
+                    await asyncio.to_thread(_write_text_atomic, output_path, content)
+                    content = None
 
             # Report completion
             if progress_callback:
                 await progress_callback(1.0, page_count, page_count, "Conversion complete")
 
-            logger.info(f"Conversion completed: {page_count} pages, {len(content)} bytes")
+            logger.info("Conversion completed: %s pages", page_count)
 
             return content, page_count, None
 
         except Exception as e:
-            logger.error(f"Conversion failed: {str(e)}", exc_info=True)
+            logger.error("Conversion failed: %s", e, exc_info=True)
             return None, None, str(e)
 
     async def _convert_with_docling_async(
         self,
         input_path: Path,
         output_format: str,
-        progress_callback: Optional[Callable[[float, int, int, str], Awaitable[None]]] = None
-    ) -> Tuple[str, int]:
+        progress_callback: Optional[Callable[[float, int, int, str], Awaitable[None]]] = None,
+        images_dir: Optional[Path] = None,
+        output_path: Optional[Path] = None,
+        pretty: bool = False,
+        do_ocr: bool = False,
+        do_table_structure: bool = True
+    ) -> Tuple[Optional[str], int]:
         """
-        Convert document using Docling library with progress tracking.
+        Convert document in a worker process with progress tracking.
+
+        Dispatches the CPU-bound conversion to the shared process pool so
+        concurrent jobs run in parallel instead of serializing on the GIL,
+        and the event loop stays responsive for status polls.
 
         Args:
             input_path: Path to input file
             output_format: Target format (html, markdown, docbook)
             progress_callback: Optional async callback for progress updates
+            images_dir: Optional directory for referenced-image output
+            output_path: When set, the worker writes the export here and
+                         content comes back as None
+            pretty: Indent json output for human readers (compact default)
+            do_ocr: Run OCR on page images (off by default)
+            do_table_structure: Run the table-structure model
 
         Returns:
             Tuple of (content, page_count)
-            content contains HTML/XML with base64-embedded images
+            content contains HTML/XML with base64-embedded images, or None
+            when output_path was written instead
         """
         try:
-            logger.info(f"Starting Docling conversion: {input_path}")
+            logger.info("Starting Docling conversion: %s", input_path)
+
+            # Large PDFs: split into page ranges and fan out across the
+            # worker pool so slices convert in parallel. Limited to embedded
+            # html/markdown output - referenced-image and lossless formats
+            # (json, doctags) need a single-document export.
+            if (CHUNK_PAGES > 0
+                    and pypdfium2 is not None
+                    and images_dir is None
+                    and output_format not in ("json", "doctags")
+                    and input_path.suffix.lower() == ".pdf"):
+                total_pages = _pdf_page_count(input_path)
+                if total_pages and total_pages > CHUNK_PAGES:
+                    content, page_count = await self._convert_chunked(
+                        input_path, output_format, total_pages, progress_callback,
+                        do_ocr=do_ocr, do_table_structure=do_table_structure
+                    )
+                    if output_path is not None:
+                        await asyncio.to_thread(_write_text_atomic, output_path, content)
+                        content = None
+                    return content, page_count
 
             if progress_callback:
                 await progress_callback(0.20, 0, 0, "Processing PDF pages (typically takes 5-10 minutes)...")
 
-            # Convert document with Docling (this is CPU-intensive and blocking)
-            # We'll run it in a thread pool to avoid blocking the event loop
-            import asyncio
-            import threading
-            import time
-
-            loop = asyncio.get_event_loop()
-
-            # Start heartbeat thread to provide periodic updates
-            heartbeat_active = threading.Event()
-            heartbeat_active.set()
-
-            def send_heartbeat():
-                elapsed = 0
-                while heartbeat_active.is_set():
-                    time.sleep(30)  # Every 30 seconds
-                    if heartbeat_active.is_set():
-                        elapsed += 30
-                        asyncio.run_coroutine_threadsafe(
-                            progress_callback(0.20, 0, 0,
-                                f"Processing PDF pages... ({elapsed}s elapsed)"),
-                            loop
+            loop = asyncio.get_running_loop()
+
+            # Periodic progress ping while the worker process runs - a plain
+            # asyncio task instead of a dedicated OS thread, cancelled in the
+            # finally so it can never fire after completion
+            async def heartbeat():
+                start = time.monotonic()
+                while True:
+                    await asyncio.sleep(30)  # Every 30 seconds
+                    if progress_callback:
+                        await progress_callback(
+                            0.20, 0, 0,
+                            f"Processing PDF pages... ({int(time.monotonic() - start)}s elapsed)"
                         )
 
-            heartbeat_thread = threading.Thread(target=send_heartbeat, daemon=True)
-            heartbeat_thread.start()
+            heartbeat_task = asyncio.create_task(heartbeat())
 
             try:
-                # Run conversion in executor
-                result = await loop.run_in_executor(
-                    None,
-                    self.converter.convert,
-                    str(input_path)
+                # Run conversion in a worker process
+                content, page_count = await loop.run_in_executor(
+                    _get_conversion_pool(),
+                    _convert_in_worker,
+                    str(input_path),
+                    output_format,
+                    str(images_dir) if images_dir else None,
+                    str(output_path) if output_path else None,
+                    pretty,
+                    do_ocr,
+                    do_table_structure
                 )
             finally:
-                # Stop heartbeat thread
-                heartbeat_active.clear()
-
-            # Get page count from result
-            page_count = len(result.document.pages) if hasattr(result.document, 'pages') else 1
-            logger.info(f"Docling conversion complete: {page_count} pages")
+                heartbeat_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await heartbeat_task
 
             if progress_callback:
-                await progress_callback(0.60, page_count, page_count, f"Processed {page_count} pages, exporting with base64 images...")
+                await progress_callback(0.90, page_count, page_count, "Finalizing output...")
+
+            logger.info("Conversion finished (%d pages)", page_count)
+            return content, page_count
+
+        except Exception as e:
+            logger.error("Docling conversion failed: %s", e, exc_info=True)
+            raise
+
+    async def _convert_chunked(
+        self,
+        input_path: Path,
+        output_format: str,
+        total_pages: int,
+        progress_callback: Optional[Callable[[float, int, int, str], Awaitable[None]]] = None,
+        do_ocr: bool = False,
+        do_table_structure: bool = True
+    ) -> Tuple[str, int]:
+        """
+        Convert a large PDF as parallel page-range slices.
+
+        Slices are written next to the input, converted concurrently on the
+        worker pool, stitched back together in document order, and deleted
+        afterwards. Slice completions double as progress updates, so no
+        heartbeat task is needed on this path.
+
+        Args:
+            input_path: Path to the input PDF
+            output_format: Target format (html, markdown)
+            total_pages: Page count of the input PDF
+            progress_callback: Optional async callback for progress updates
 
-            # Count images
-            image_count = len(result.document.pictures) if hasattr(result.document, 'pictures') and result.document.pictures else 0
-            logger.info(f"Found {image_count} images to embed as base64")
+        Returns:
+            Tuple of (content, page_count)
+        """
+        loop = asyncio.get_running_loop()
+        slice_paths = await asyncio.to_thread(_split_pdf, input_path, CHUNK_PAGES)
+        logger.info(
+            "Converting %s as %d slices of up to %d pages",
+            input_path.name, len(slice_paths), CHUNK_PAGES
+        )
+
+        if progress_callback:
+            await progress_callback(
+                0.20, 0, total_pages,
+                f"Processing {total_pages} pages in {len(slice_paths)} parallel slices..."
+            )
 
+        completed = 0
+
+        async def convert_slice(slice_path: Path) -> Tuple[str, int]:
+            nonlocal completed
+            content_pages = await loop.run_in_executor(
+                _get_conversion_pool(),
+                _convert_in_worker,
+                str(slice_path),
+                output_format,
+                None,  # images_dir - chunking only runs in embedded mode
+                None,  # output_path - slices are stitched in memory
+                False,
+                do_ocr,
+                do_table_structure
+            )
+            completed += 1
             if progress_callback:
-                await progress_callback(0.70, page_count, page_count, f"Embedding {image_count} images as base64...")
-
-            # Export based on format with EMBEDDED base64 images
-            if output_format == "markdown":
-                content = result.document.export_to_markdown(image_mode=ImageRefMode.EMBEDDED)
-            elif output_format == "doctags":
-                # DocTags format - structured for LLMs
-                content = result.document.export_to_doctags()
-            elif output_format == "json":
-                # JSON format - lossless representation
-                content = json.dumps(result.document.export_to_dict(), indent=2)
-            else:  # html or xml - always return HTML (Blazor will convert to XML if needed)
+                await progress_callback(
+                    0.20 + 0.70 * completed / len(slice_paths),
+                    min(completed * CHUNK_PAGES, total_pages),
+                    total_pages,
+                    f"Converted slice {completed}/{len(slice_paths)}"
+                )
+            return content_pages
+
+        try:
+            # Order of results follows slice_paths, not completion order
+            results = await asyncio.gather(*(convert_slice(p) for p in slice_paths))
+        finally:
+            for slice_path in slice_paths:
+                slice_path.unlink(missing_ok=True)
+
+        parts = [content for content, _ in results]
+        if output_format == "markdown":
+            content = "\n\n".join(parts)
+        else:
+            content = _stitch_html(parts)
+
+        logger.info(
+            "Stitched %d slices into %d bytes (%d pages)",
+            len(parts), len(content), total_pages
+        )
+        return content, total_pages
+
+    def convert_document(
+        self,
+        input_path: Path,
+        output_format: str,
+        images_dir: Optional[Path] = None,
+        output_path: Optional[Path] = None,
+        pretty: bool = False,
+        do_ocr: bool = False,
+        do_table_structure: bool = True
+    ) -> Tuple[Optional[str], int]:
+        """
+        Convert a document synchronously (runs inside a pool worker process).
+
+        Args:
+            input_path: Path to input file
+            output_format: Target format (html, markdown, doctags, json)
+            images_dir: When set, HTML output references image files written
+                        here instead of embedding them as base64
+            output_path: When set, the export is written to this file and
+                         None is returned for the content - the full output
+                         string never has to exist alongside the in-memory
+                         images it was built from
+            pretty: Indent json output for human readers (compact default)
+            do_ocr: Run OCR on page images (off by default - the dominant
+                    cost, unneeded for born-digital PDFs)
+            do_table_structure: Run the table-structure model
+
+        Returns:
+            Tuple of (content, page_count)
+            content contains HTML/XML with base64-embedded images (unless
+            images_dir is given); None when output_path was written instead
+
+        Raises:
+            RuntimeError: If the Docling converter cannot be initialized
+        """
+        if not self._ensure_converter_initialized(do_ocr, do_table_structure):
+            raise RuntimeError("Docling converter is not available")
+
+        result = self.converter.convert(str(input_path))
+
+        # Get page count from result
+        page_count = len(result.document.pages) if hasattr(result.document, 'pages') else 1
+        logger.info("Docling conversion complete: %d pages", page_count)
+
+        # Count images
+        image_count = len(result.document.pictures) if hasattr(result.document, 'pictures') and result.document.pictures else 0
+        logger.info("Found %d images to embed as base64", image_count)
+
+        # Re-encode pictures before embedding when IMAGE_FORMAT asks for a
+        # lossy format. Referenced mode keeps docling's PNGs - the files on
+        # disk are named *.png and must stay that format.
+        if images_dir is None and image_count:
+            self._reencode_pictures(result.document)
+
+        # Export via the format dispatch table (EMBEDDED base64 images)
+        content: Optional[str]
+        exporter = EXPORTERS.get(output_format)
+        if exporter is not None:
+            content = exporter(result.document, pretty)
+        else:  # html or xml - always return HTML (Blazor will convert to XML if needed)
+            if images_dir is not None:
+                # Referenced mode: images land on disk and the HTML points at
+                # them, shrinking the output by the base64 overhead (~33%)
+                # plus the image bytes themselves
+                content = self._export_html_referenced(result.document, images_dir, output_path)
+            elif output_path is not None:
+                # File export: save_as_html writes straight to disk, so the
+                # base64 image text never doubles up in RAM next to the
+                # decoded image bytes held by the document. Export lands in
+                # a temp sibling and renames into place so readers never see
+                # a half-written result.
+                tmp_path = output_path.with_name(output_path.name + ".tmp")
+                result.document.save_as_html(tmp_path, image_mode=ImageRefMode.EMBEDDED)
+                os.replace(tmp_path, output_path)
+                content = None
+            else:
                 content = result.document.export_to_html(image_mode=ImageRefMode.EMBEDDED)
 
-            if progress_callback:
-                await progress_callback(0.90, page_count, page_count, "Finalizing output...")
+        if output_path is not None and content is not None:
+            _write_text_atomic(output_path, content)
+            content = None
 
-            logger.info(f"Generated output: {len(content)} bytes with {image_count} embedded images")
-            return content, page_count
+        if content is not None:
+            logger.info("Generated output: %d bytes with %d images", len(content), image_count)
+        else:
+            logger.info(
+                "Generated output: %d bytes with %d images (written to %s)",
+                output_path.stat().st_size, image_count, output_path.name
+            )
+        return content, page_count
 
-        except Exception as e:
-            logger.error(f"Docling conversion failed: {str(e)}", exc_info=True)
-            raise
+    def _reencode_pictures(self, document):
+        """
+        Re-encode extracted pictures as JPEG or WebP before embedding.
+
+        Docling stores pictures as PNG data URIs; for the photographic
+        figures typical of annual reports, JPEG at quality 85 is 5-10x
+        smaller, and the saving carries through the 1.33x base64 inflation
+        into the HTML output. No-op unless IMAGE_FORMAT is jpeg or webp.
+        """
+        if IMAGE_FORMAT not in ("jpeg", "webp"):
+            return
+
+        import base64
+        import io
+        from pydantic import AnyUrl
+
+        reencoded = 0
+        for picture in getattr(document, "pictures", None) or []:
+            ref = picture.image
+            if ref is None:
+                continue
+            try:
+                pil_image = ref.pil_image
+                if pil_image is None:
+                    continue
+                # JPEG has no alpha channel; flatten palette/alpha modes
+                if IMAGE_FORMAT == "jpeg" and pil_image.mode not in ("RGB", "L"):
+                    pil_image = pil_image.convert("RGB")
+                buffer = io.BytesIO()
+                pil_image.save(
+                    buffer,
+                    format=IMAGE_FORMAT.upper(),
+                    quality=IMAGE_QUALITY,
+                    optimize=True
+                )
+                encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+                ref.mimetype = f"image/{IMAGE_FORMAT}"
+                ref.uri = AnyUrl(f"data:image/{IMAGE_FORMAT};base64,{encoded}")
+                reencoded += 1
+            except Exception as e:
+                # A single bad picture shouldn't fail the conversion - keep
+                # the original PNG for this one
+                logger.warning("Could not re-encode picture as %s: %s", IMAGE_FORMAT, e)
+
+        if reencoded:
+            logger.info("Re-encoded %d pictures as %s (quality %d)", reencoded, IMAGE_FORMAT, IMAGE_QUALITY)
+
+    def _export_html_referenced(
+        self,
+        document,
+        images_dir: Path,
+        output_path: Optional[Path] = None
+    ) -> Optional[str]:
+        """
+        Export HTML that references extracted image files instead of
+        embedding them as base64 data URIs.
+
+        Images are written to images_dir; docling references them
+        relatively as '<images_dir.name>/<file>', which only resolves
+        next to the file on disk - the client receives this HTML through
+        the result endpoint, where relative refs would resolve against
+        the client's own origin. The references are therefore rewritten
+        to the absolute API path '/jobs/{job_id}/images/<file>' that
+        GET /jobs/{job_id}/images/{file} actually serves. The rewritten
+        HTML goes to output_path when one is given (returning None
+        instead of the content string).
+        """
+        images_dir.mkdir(parents=True, exist_ok=True)
+        output_file = images_dir.parent / "output.html"
+        document.save_as_html(
+            output_file,
+            image_mode=ImageRefMode.REFERENCED,
+            artifacts_dir=Path(images_dir.name)
+        )
+        content = output_file.read_text("utf-8")
+        output_file.unlink(missing_ok=True)
+        # images_dir is results_dir/{job_id}/images, so the parent's name
+        # is the job id the images endpoint expects
+        job_id = images_dir.parent.name
+        content = content.replace(
+            f'src="{images_dir.name}/',
+            f'src="/jobs/{job_id}/images/'
+        )
+        if output_path is not None:
+            _write_text_atomic(output_path, content)
+            return None
+        return content
 
     def _create_placeholder_output(
         self,
@@ -278,27 +1010,8 @@ class DoclingConverter:
         Returns:
             Tuple of (content, page_count)
         """
-        # Create a simple DocBook XML placeholder
-        placeholder_content = """<?xml version="1.0" encoding="UTF-8"?>
-<book xmlns="http://docbook.org/ns/docbook" version="5.0">
-    <info>
-        <title>Placeholder Document</title>
-        <subtitle>Converted by Docling Service</subtitle>
-    </info>
-    <chapter>
-        <title>Placeholder Chapter</title>
-        <para>
-            This is a placeholder output from the Docling service.
-            The actual Docling conversion will be implemented in Phase 1.2.
-        </para>
-        <para>
-            Source file: {}
-        </para>
-        <para>
-            Output format: {}
-        </para>
-    </chapter>
-</book>""".format(input_path.name, output_format)
+        # Simple DocBook XML placeholder from the module-level template
+        placeholder_content = _PLACEHOLDER_TEMPLATE.format(input_path.name, output_format)
 
         # Return placeholder content and page count
         return placeholder_content, 1
@@ -2,12 +2,17 @@
 
 import asyncio
 import logging
+import os
+import shutil
+import socket
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Dict, Optional, Callable, Awaitable
 from pathlib import Path
 
-from models.job_models import JobStatus, JobInfo
+from models.job_models import JobStatus, JobInfo, utc_now
+from services.job_store import create_job_store_from_env
 
 logger = logging.getLogger(__name__)
 
@@ -16,42 +21,113 @@ class JobManager:
     """
     Manages background conversion jobs with progress tracking.
 
-    Uses in-memory storage for simplicity. Jobs are processed sequentially
-    since Docling is CPU-intensive.
+    Uses in-memory storage for simplicity. JOB_WORKERS worker loops pull
+    from one shared queue, so that many jobs convert concurrently - each
+    on its own process-pool worker. Keep JOB_WORKERS matched to
+    CONVERT_WORKERS; extra loops would just queue inside the pool.
     """
 
-    def __init__(self, cleanup_age_hours: int = 1):
+    # Result file extension per output format (default: .html)
+    _RESULT_EXTENSIONS = {"markdown": ".md", "json": ".json", "doctags": ".doctags"}
+
+    def __init__(
+        self,
+        cleanup_age_hours: int = 1,
+        results_dir: Path = Path("/app/data/temp/results")
+    ):
         """
         Initialize job manager.
 
         Args:
             cleanup_age_hours: Remove completed jobs older than this many hours
+            results_dir: Directory where conversion results are written
         """
         self.jobs: Dict[str, JobInfo] = {}
+        # Stamped onto every job this instance creates, so restart recovery
+        # against a shared store can tell our jobs from a sibling worker's
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}"
         self.cleanup_age = timedelta(hours=cleanup_age_hours)
+        self.results_dir = results_dir
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        # Optional write-through Redis persistence (enabled via REDIS_URL)
+        # so job state survives restarts and is visible to other workers
+        self._store = create_job_store_from_env()
         self._processing = False
         self._queue = asyncio.Queue()
-        self._worker_task: Optional[asyncio.Task] = None
+        self.max_concurrent = int(
+            os.getenv("JOB_WORKERS", os.getenv("CONVERT_WORKERS", "2"))
+        )
+        self._workers: list[asyncio.Task] = []
+        # Conversion tasks currently being awaited, by job_id, so
+        # cancel_job can cancel one instead of letting an abandoned
+        # conversion run to completion
+        self._running: Dict[str, asyncio.Task] = {}
+        # Serialized status JSON per job, invalidated on mutation - clients
+        # poll every 2 s, so between updates the status endpoint can return
+        # the same bytes without re-serializing the model
+        self._status_cache: Dict[str, bytes] = {}
         logger.info("JobManager initialized")
 
+    async def _recover_jobs(self):
+        """Rebuild self.jobs from a store that supports enumeration.
+
+        Jobs are inserted in creation order so the early-exit scan in
+        cleanup_old_jobs keeps working. On a shared store (Redis), only
+        jobs stamped with this instance's owner id are reclaimed - a
+        single respawned worker must not clobber jobs that sibling
+        workers are still running. The JSONL log is exclusive to one
+        process, so everything in it is ours regardless of owner stamp.
+        Reclaimed jobs that were still live are marked failed, since
+        their conversion tasks died with the previous process; live jobs
+        orphaned in Redis by a crash simply age out via the store TTL.
+        """
+        loader = getattr(self._store, "load_all", None)
+        if loader is None:
+            return
+        exclusive = getattr(self._store, "exclusive", False)
+        for job in sorted(await loader(), key=lambda j: j.created_at):
+            if not exclusive and job.owner_id != self.owner_id:
+                continue
+            if job.status in (JobStatus.QUEUED, JobStatus.PROCESSING):
+                job.status = JobStatus.FAILED
+                job.error = "Service restarted before the job finished"
+                job.message = "Job interrupted by service restart"
+                job.completed_at = utc_now()
+                await self._persist(job)
+            self.jobs[job.job_id] = job
+        if self.jobs:
+            logger.info("Recovered %d jobs from the persisted job store", len(self.jobs))
+
     async def start_worker(self):
-        """Start background worker task."""
-        if self._worker_task is None:
-            self._worker_task = asyncio.create_task(self._worker_loop())
-            logger.info("Background worker started")
+        """Start the background worker tasks."""
+        if not self._workers:
+            # Recover persisted jobs before accepting new work; needs the
+            # running loop, so it lives here rather than in __init__
+            await self._recover_jobs()
+            self._workers = [
+                asyncio.create_task(self._worker_loop(index))
+                for index in range(self.max_concurrent)
+            ]
+            # The JSONL store batches fsyncs in a background task that needs
+            # a running event loop, so it starts here rather than in __init__
+            starter = getattr(self._store, "start_sync_task", None)
+            if starter is not None:
+                starter()
+            logger.info("Started %d background workers", len(self._workers))
 
     async def stop_worker(self):
-        """Stop background worker task."""
-        if self._worker_task:
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
-            self._worker_task = None
-            logger.info("Background worker stopped")
-
-    def create_job(
+        """Stop all background worker tasks."""
+        if self._workers:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+            closer = getattr(self._store, "close", None)
+            if closer is not None:
+                await closer()
+            logger.info("Background workers stopped")
+
+    async def create_job(
         self,
         filename: str,
         output_format: str = "docbook"
@@ -74,14 +150,24 @@ class JobManager:
             progress=0.0,
             message="Job queued for processing",
             filename=filename,
-            output_format=output_format
+            output_format=output_format,
+            owner_id=self.owner_id
         )
 
         self.jobs[job_id] = job
-        logger.info(f"Created job {job_id}: file={filename}, format={output_format}")
+        await self._persist(job)
+        logger.info("Created job %s: file=%s, format=%s", job_id, filename, output_format)
 
         return job_id
 
+    async def _persist(self, job: JobInfo):
+        """Write a job's current state through to the external store, if any."""
+        # Every state mutation funnels through here, so this is also where
+        # the serialized-status cache gets invalidated
+        self._status_cache.pop(job.job_id, None)
+        if self._store:
+            await self._store.save(job)
+
     async def enqueue_job(
         self,
         job_id: str,
@@ -93,12 +179,12 @@ class JobManager:
         Args:
             job_id: Job identifier
             conversion_func: Async function to execute conversion
-                            Should accept (job_id, progress_callback) and return (output_content, page_count, error)
+                            Should accept (job_id, progress_callback) and return (output_path, page_count, error)
         """
         await self._queue.put((job_id, conversion_func))
-        logger.info(f"Enqueued job {job_id} (queue size: {self._queue.qsize()})")
+        logger.info("Enqueued job %s (queue size: %d)", job_id, self._queue.qsize())
 
-    def get_job(self, job_id: str) -> Optional[JobInfo]:
+    async def get_job(self, job_id: str) -> Optional[JobInfo]:
         """
         Get job status.
 
@@ -108,9 +194,46 @@ class JobManager:
         Returns:
             JobInfo if found, None otherwise
         """
-        return self.jobs.get(job_id)
+        job = self.jobs.get(job_id)
+        if job is None and self._store:
+            # Another worker owns this job: its live state belongs to that
+            # process, so re-read the store on every lookup instead of
+            # caching a copy here that would freeze at the first observed
+            # status (and never be cleaned up by our cleanup scan).
+            job = await self._store.load(job_id)
+        return job
+
+    async def get_job_serialized(self, job_id: str) -> Optional[bytes]:
+        """
+        Get a job's status as pre-serialized JSON bytes.
 
-    def update_progress(
+        Clients poll every 2 seconds while progress updates are coalesced to
+        a few per second at most, so most polls see an unchanged job. Caching
+        the serialized form lets the status endpoint return the same bytes
+        without re-serializing the model on every poll.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            JSON-encoded JobInfo if found, None otherwise
+        """
+        cached = self._status_cache.get(job_id)
+        if cached is not None:
+            return cached
+        job = await self.get_job(job_id)
+        if job is None:
+            return None
+        data = job.model_dump_json().encode("utf-8")
+        # Only cache jobs this process holds: their mutations all pass
+        # through _persist, which invalidates the entry. A job owned by
+        # another worker is updated over in that process, so its bytes
+        # must be re-read from the store on every poll.
+        if job_id in self.jobs:
+            self._status_cache[job_id] = data
+        return data
+
+    async def update_progress(
         self,
         job_id: str,
         progress: float,
@@ -138,9 +261,55 @@ class JobManager:
             if message:
                 job.message = message
 
-            logger.debug(f"Job {job_id} progress: {job.progress:.1%} - {job.message}")
+            await self._persist(job)
+            logger.debug("Job %s progress: %.1f%% - %s", job_id, job.progress * 100, job.message)
+
+    def result_path(self, job_id: str, output_format: Optional[str]) -> Path:
+        """
+        Build the on-disk result path for a job.
+
+        Args:
+            job_id: Job identifier
+            output_format: Target format (determines file extension)
+
+        Returns:
+            Path under results_dir for this job's output
+        """
+        ext = self._RESULT_EXTENSIONS.get(output_format or "", ".html")
+        return self.results_dir / f"{job_id}{ext}"
 
-    def cancel_job(self, job_id: str) -> bool:
+    async def complete_job(
+        self,
+        job_id: str,
+        output_path: str,
+        page_count: Optional[int] = None,
+        message: str = "Conversion completed"
+    ):
+        """
+        Mark a job as completed with an existing result file.
+
+        Used when a result is already available on disk (e.g. a duplicate
+        upload reusing a previous job's output) and no conversion needs to run.
+
+        Args:
+            job_id: Job identifier
+            output_path: Path to the converted output file
+            page_count: Number of pages in document
+            message: Status message
+        """
+        job = self.jobs.get(job_id)
+        if job:
+            job.status = JobStatus.COMPLETED
+            job.progress = 1.0
+            job.total_pages = page_count
+            job.output_path = output_path
+            job.message = message
+            job.started_at = job.started_at or utc_now()
+            job.completed_at = utc_now()
+            await self._persist(job)
+            logger.info("Completed job %s with pre-computed result", job_id)
+
+    async def cancel_job(self, job_id: str) -> bool:
         """
         Cancel a job.
 
@@ -154,33 +323,60 @@ class JobManager:
         if job and job.status in (JobStatus.QUEUED, JobStatus.PROCESSING):
             job.status = JobStatus.CANCELLED
             job.message = "Job cancelled by user"
-            job.completed_at = datetime.utcnow()
-            logger.info(f"Cancelled job {job_id}")
+            job.completed_at = utc_now()
+            # Cancel the in-flight conversion task. A pool work item that
+            # hasn't started yet is withdrawn from the queue; one already
+            # running in a worker process finishes but its result is
+            # discarded - best effort, since the child can't be interrupted
+            # mid-conversion without killing the warm worker.
+            running = self._running.get(job_id)
+            if running is not None and not running.done():
+                running.cancel()
+            await self._persist(job)
+            logger.info("Cancelled job %s", job_id)
             return True
         return False
 
-    def cleanup_old_jobs(self):
+    async def cleanup_old_jobs(self):
         """Remove completed jobs older than cleanup_age."""
-        cutoff = datetime.utcnow() - self.cleanup_age
-        to_remove = [
-            job_id for job_id, job in self.jobs.items()
-            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
-            and job.completed_at
-            and job.completed_at < cutoff
-        ]
+        cutoff = utc_now() - self.cleanup_age
+        to_remove = []
+        for job_id, job in self.jobs.items():
+            # Jobs sit in creation order and completed_at >= created_at, so
+            # once we reach a job created after the cutoff nothing further
+            # can be old enough to clean up - O(deleted) instead of O(jobs)
+            # for this once-a-minute scan.
+            if job.created_at >= cutoff:
+                break
+            if (job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+                    and job.completed_at
+                    and job.completed_at < cutoff):
+                to_remove.append(job_id)
 
         for job_id in to_remove:
-            del self.jobs[job_id]
-            logger.info(f"Cleaned up old job {job_id}")
-
-    async def _worker_loop(self):
-        """Background worker that processes jobs from queue."""
-        logger.info("Worker loop started")
+            job = self.jobs.pop(job_id)
+            self._status_cache.pop(job_id, None)
+            if self._store:
+                await self._store.delete(job_id)
+            # Evict the result file from disk, unless a later duplicate-upload
+            # job still points at the same file
+            if job.output_path and not any(
+                j.output_path == job.output_path for j in self.jobs.values()
+            ):
+                Path(job.output_path).unlink(missing_ok=True)
+            # Per-job artifacts directory (referenced-mode images)
+            shutil.rmtree(self.results_dir / job_id, ignore_errors=True)
+            logger.info("Cleaned up old job %s", job_id)
+
+    async def _worker_loop(self, worker_index: int = 0):
+        """Background worker that processes jobs from the shared queue."""
+        logger.info("Worker loop %d started", worker_index)
 
         try:
             while True:
-                # Cleanup old jobs periodically
-                self.cleanup_old_jobs()
+                # Cleanup old jobs periodically (one worker is enough)
+                if worker_index == 0:
+                    await self.cleanup_old_jobs()
 
                 # Get next job from queue (with timeout to allow periodic cleanup)
                 try:
@@ -193,53 +389,91 @@ class JobManager:
 
                 job = self.jobs.get(job_id)
                 if not job:
-                    logger.warning(f"Job {job_id} not found, skipping")
+                    logger.warning("Job %s not found, skipping", job_id)
                     continue
 
                 # Skip if already cancelled
                 if job.status == JobStatus.CANCELLED:
-                    logger.info(f"Job {job_id} was cancelled, skipping")
+                    logger.info("Job %s was cancelled, skipping", job_id)
                     continue
 
                 # Mark as processing
                 job.status = JobStatus.PROCESSING
-                job.started_at = datetime.utcnow()
+                job.started_at = utc_now()
                 job.message = "Processing started"
-                logger.info(f"Processing job {job_id}")
+                await self._persist(job)
+                logger.info("Processing job %s", job_id)
 
                 try:
-                    # Create progress callback
-                    async def progress_callback(progress: float, current_page: int, total_pages: int, message: str):
-                        self.update_progress(job_id, progress, current_page, total_pages, message)
+                    # Create progress callback.
+                    # Updates are coalesced: on large PDFs per-page callbacks
+                    # would mean thousands of job-state mutations that no
+                    # 2-second client poll can observe. Publish only when
+                    # progress advanced >= 1%, >= 250 ms passed, or the
+                    # update is terminal.
+                    last_publish = 0.0
+                    last_progress = -1.0
 
-                    # Execute conversion
-                    output_content, page_count, error = await conversion_func(job_id, progress_callback)
+                    async def progress_callback(progress: float, current_page: int, total_pages: int, message: str):
+                        nonlocal last_publish, last_progress
+                        now = time.monotonic()
+                        if (progress < 1.0
+                                and now - last_publish < 0.25
+                                and progress - last_progress < 0.01):
+                            return
+                        last_publish = now
+                        last_progress = progress
+                        await self.update_progress(job_id, progress, current_page, total_pages, message)
+
+                    # Execute conversion. The converter writes the result to
+                    # disk itself and hands back the path, so completed jobs
+                    # never hold the output in RAM; the result endpoint reads
+                    # the file lazily on demand. Wrapped in a task so
+                    # cancel_job can cancel it mid-flight.
+                    self._running[job_id] = asyncio.ensure_future(
+                        conversion_func(job_id, progress_callback)
+                    )
+                    output_path, page_count, error = await self._running[job_id]
 
                     # Update job with result
-                    job.completed_at = datetime.utcnow()
+                    job.completed_at = utc_now()
 
                     if error:
                         job.status = JobStatus.FAILED
                         job.error = error
                         job.message = f"Conversion failed: {error}"
-                        logger.error(f"Job {job_id} failed: {error}")
+                        logger.error("Job %s failed: %s", job_id, error)
                     else:
                         job.status = JobStatus.COMPLETED
                         job.progress = 1.0
                         job.total_pages = page_count
-                        job.output_content = output_content  # Store the content in job
+                        job.output_path = output_path
                         job.message = f"Conversion completed ({page_count} pages)"
-                        logger.info(f"Job {job_id} completed successfully")
+                        logger.info("Job %s completed successfully", job_id)
+
+                    await self._persist(job)
+
+                except asyncio.CancelledError:
+                    # cancel_job already marked the job and set completed_at;
+                    # anything else cancelling us is the worker loop being
+                    # stopped, which must keep propagating
+                    if job.status != JobStatus.CANCELLED:
+                        raise
+                    logger.info("Job %s conversion cancelled mid-flight", job_id)
 
                 except Exception as e:
                     job.status = JobStatus.FAILED
                     job.error = str(e)
                     job.message = f"Conversion failed: {str(e)}"
-                    job.completed_at = datetime.utcnow()
-                    logger.error(f"Job {job_id} failed with exception: {e}", exc_info=True)
+                    job.completed_at = utc_now()
+                    await self._persist(job)
+                    logger.error("Job %s failed with exception: %s", job_id, e, exc_info=True)
+
+                finally:
+                    self._running.pop(job_id, None)
 
         except asyncio.CancelledError:
-            logger.info("Worker loop cancelled")
+            logger.info("Worker loop %d cancelled", worker_index)
             raise
 
 
@@ -0,0 +1,251 @@
+"""Optional persistence backends for job state.
+
+When REDIS_URL is set (e.g. redis://redis:6379/0), the JobManager writes
+every job state change through to Redis and falls back to it on local
+misses. This lets job status survive a service restart and be shared
+across multiple uvicorn workers, which the in-memory dict alone cannot do.
+
+When JOB_LOG_PATH is set instead (e.g. /app/data/jobs.log), job state is
+appended to a local JSONL log with delayed fsync: writes cost one buffered
+os.write each, and a single background task syncs the file to disk every
+100 ms while there are unsynced writes. On startup the log is replayed to
+recover jobs from before a restart.
+
+Without either variable (the default single-process deployment) nothing
+changes: jobs live only in the in-memory dict.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from models.job_models import JobInfo
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+
+class RedisJobStore:
+    """Write-through store for JobInfo records in Redis.
+
+    Each job is stored as a JSON string under job:{id} with a TTL, so
+    expired jobs disappear from Redis without an explicit cleanup pass.
+    Uses the asyncio Redis client: every call site runs on the event
+    loop, where a synchronous network round-trip would stall all
+    in-flight requests for the duration.
+    """
+
+    # The store is shared between worker instances: restart recovery must
+    # respect per-job ownership rather than reclaiming everything in it
+    exclusive = False
+
+    def __init__(self, url: str, ttl_seconds: int = 3600):
+        """
+        Initialize the store.
+
+        The async client connects lazily on first use, so connectivity
+        problems surface as per-operation warnings rather than at startup.
+
+        Args:
+            url: Redis connection URL
+            ttl_seconds: Expiry for stored jobs (matches JobManager cleanup age)
+        """
+        self._client = redis.asyncio.Redis.from_url(url)
+        self.ttl = ttl_seconds
+
+    async def save(self, job: JobInfo):
+        """Persist the current state of a job (overwrites, refreshes TTL)."""
+        try:
+            await self._client.set(f"job:{job.job_id}", job.model_dump_json(), ex=self.ttl)
+        except Exception as e:
+            logger.warning("Failed to persist job %s to Redis: %s", job.job_id, e)
+
+    async def load(self, job_id: str) -> Optional[JobInfo]:
+        """Load a job by id, or None if unknown/expired."""
+        try:
+            data = await self._client.get(f"job:{job_id}")
+        except Exception as e:
+            logger.warning("Failed to load job %s from Redis: %s", job_id, e)
+            return None
+        if data is None:
+            return None
+        return JobInfo.model_validate_json(data)
+
+    async def load_all(self) -> List[JobInfo]:
+        """All jobs currently in the store (used for restart recovery)."""
+        jobs = []
+        try:
+            async for key in self._client.scan_iter(match="job:*"):
+                data = await self._client.get(key)
+                if data is not None:
+                    jobs.append(JobInfo.model_validate_json(data))
+        except Exception as e:
+            logger.warning("Failed to enumerate jobs from Redis: %s", e)
+        return jobs
+
+    async def delete(self, job_id: str):
+        """Remove a job from the store."""
+        try:
+            await self._client.delete(f"job:{job_id}")
+        except Exception as e:
+            logger.warning("Failed to delete job %s from Redis: %s", job_id, e)
+
+
+class JsonlJobStore:
+    """Append-only JSONL store for JobInfo records with delayed fsync.
+
+    Every save appends one JSON line to the log via a buffered os.write;
+    deletes append a tombstone line. Nothing fsyncs inline - a background
+    task calls fdatasync once per SYNC_INTERVAL while writes are pending,
+    so a burst of progress updates costs one disk sync instead of one per
+    update. Crash durability is bounded by the sync interval.
+
+    The full job state is kept in memory (it is the replayed snapshot), so
+    loads never touch the file. On startup the log is replayed - last line
+    per job wins, tombstones remove - and compacted so the file does not
+    grow across restarts.
+    """
+
+    # How long pending writes may sit unsynced before fdatasync runs
+    SYNC_INTERVAL = 0.1
+
+    # The log file belongs to exactly one process, so restart recovery may
+    # reclaim every job in it
+    exclusive = True
+
+    def __init__(self, path: str):
+        """
+        Initialize the store, replaying and compacting any existing log.
+
+        Args:
+            path: Location of the JSONL job log
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._snapshot: dict[str, JobInfo] = self._replay()
+        self._compact()
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._dirty = False
+        self._sync_task: Optional[asyncio.Task] = None
+
+    def _replay(self) -> dict[str, JobInfo]:
+        """Rebuild job state from the log; last record per job wins."""
+        snapshot: dict[str, JobInfo] = {}
+        if not self.path.exists():
+            return snapshot
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+                if "deleted" in record:
+                    snapshot.pop(record["deleted"], None)
+                else:
+                    job = JobInfo.model_validate(record)
+                    snapshot[job.job_id] = job
+            except (ValueError, KeyError):
+                # A torn line from a crash mid-write - skip it
+                continue
+        return snapshot
+
+    def _compact(self):
+        """Rewrite the log with one line per live job, atomically."""
+        tmp_path = self.path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            for job in self._snapshot.values():
+                os.write(fd, job.model_dump_json().encode("utf-8") + b"\n")
+            os.fdatasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.path)
+
+    def start_sync_task(self):
+        """Start the background task that periodically syncs pending writes."""
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def _sync_loop(self):
+        """Sync the log at most once per interval while writes are pending."""
+        try:
+            while True:
+                await asyncio.sleep(self.SYNC_INTERVAL)
+                if self._dirty:
+                    self._dirty = False
+                    os.fdatasync(self._fd)
+        except asyncio.CancelledError:
+            if self._dirty:
+                os.fdatasync(self._fd)
+            raise
+
+    async def close(self):
+        """Stop the sync task, flush pending writes and close the log."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            await asyncio.gather(self._sync_task, return_exceptions=True)
+            self._sync_task = None
+        os.close(self._fd)
+
+    async def save(self, job: JobInfo):
+        """Append the current state of a job to the log (no inline fsync).
+
+        Async only to match the store interface - a buffered os.write to
+        the page cache does not block the loop meaningfully.
+        """
+        try:
+            os.write(self._fd, job.model_dump_json().encode("utf-8") + b"\n")
+            self._snapshot[job.job_id] = job
+            self._dirty = True
+        except OSError as e:
+            logger.warning("Failed to persist job %s to job log: %s", job.job_id, e)
+
+    async def load(self, job_id: str) -> Optional[JobInfo]:
+        """Load a job by id, or None if unknown."""
+        return self._snapshot.get(job_id)
+
+    async def load_all(self) -> List[JobInfo]:
+        """All jobs recovered from (or written to) the log."""
+        return list(self._snapshot.values())
+
+    async def delete(self, job_id: str):
+        """Remove a job from the store via a tombstone line."""
+        if self._snapshot.pop(job_id, None) is None:
+            return
+        try:
+            os.write(self._fd, json.dumps({"deleted": job_id}).encode("utf-8") + b"\n")
+            self._dirty = True
+        except OSError as e:
+            logger.warning("Failed to delete job %s from job log: %s", job_id, e)
+
+
+def create_job_store_from_env() -> "RedisJobStore | JsonlJobStore | None":
+    """Build a job store from REDIS_URL or JOB_LOG_PATH, or None when neither is configured."""
+    url = os.getenv("REDIS_URL")
+    if url:
+        if REDIS_AVAILABLE:
+            try:
+                store = RedisJobStore(url)
+                logger.info("Job state persistence enabled via Redis at %s (connects on first use)", url)
+                return store
+            except Exception as e:
+                logger.warning("Could not configure Redis at %s (%s)", url, e)
+        else:
+            logger.warning("REDIS_URL is set but the redis package is not installed")
+
+    log_path = os.getenv("JOB_LOG_PATH")
+    if log_path:
+        try:
+            store = JsonlJobStore(log_path)
+            logger.info("Job state persistence enabled via job log at %s", log_path)
+            return store
+        except Exception as e:
+            logger.warning("Could not open job log at %s (%s) - job state stays in-memory", log_path, e)
+
+    return None